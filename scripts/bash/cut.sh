@@ -13,8 +13,13 @@ check_venv
 PROJECT_DIR=$(get_current_project)
 PROJECT_NAME=$(get_project_name)
 
-# 检查检测报告是否存在
+# 检查检测报告是否存在(JSON 或列式 npz,两者都存在时使用较新的)
 REPORT_FILE="$PROJECT_DIR/clips/detect-report.json"
+NPZ_REPORT_FILE="$PROJECT_DIR/clips/detect-report.npz"
+
+if [ -f "$NPZ_REPORT_FILE" ] && { [ ! -f "$REPORT_FILE" ] || [ "$NPZ_REPORT_FILE" -nt "$REPORT_FILE" ]; }; then
+    REPORT_FILE="$NPZ_REPORT_FILE"
+fi
 
 if [ ! -f "$REPORT_FILE" ]; then
     output_json "{
@@ -25,9 +30,6 @@ if [ ! -f "$REPORT_FILE" ]; then
     exit 1
 fi
 
-# 读取检测报告
-REPORT_DATA=$(cat "$REPORT_FILE")
-
 # 解析命令行参数
 MODE="auto"  # 默认自动模式
 PREVIEW_ONLY="false"
@@ -69,6 +71,23 @@ fi
 
 # 如果是预览模式,直接输出剪辑计划
 if [ "$PREVIEW_ONLY" = "true" ]; then
+    # 读取检测报告(npz 仅在预览时转换为 JSON)
+    if [ "$REPORT_FILE" = "$NPZ_REPORT_FILE" ]; then
+        REPORT_DATA=$(run_python_script "report_format.py" to-json "$REPORT_FILE")
+        if [ $? -ne 0 ]; then
+            output_json "{
+                \"status\": \"error\",
+                \"message\": \"无法读取检测报告\",
+                \"report_file\": \"$REPORT_FILE\",
+                \"details\": $(echo "$REPORT_DATA" | jq -Rs .),
+                \"hint\": \"请重新运行 /detect 生成检测报告\"
+            }"
+            exit 1
+        fi
+    else
+        REPORT_DATA=$(cat "$REPORT_FILE")
+    fi
+
     output_json "{
         \"status\": \"preview\",
         \"project_name\": \"$PROJECT_NAME\",
@@ -111,7 +130,7 @@ if [ $EXIT_CODE -ne 0 ]; then
     if echo "$ERROR_OUTPUT" | grep -q "ModuleNotFoundError\|No module named"; then
         echo "💡 看起来是 Python 依赖缺失" >&2
         echo "   请运行: clipmate setup-python" >&2
-    elif echo "$ERROR_OUTPUT" | grep -q "无法读取检测报告\|detect-report.json"; then
+    elif echo "$ERROR_OUTPUT" | grep -q "无法读取检测报告\|detect-report"; then
         echo "💡 缺少检测报告" >&2
         echo "   请先运行: /detect" >&2
     elif echo "$ERROR_OUTPUT" | grep -q "FFmpeg"; then
@@ -29,8 +29,37 @@ fi
 # 确保 clips 目录存在
 ensure_dir "$PROJECT_DIR/clips"
 
+# 解析命令行参数
+PRESET="teaching"  # 默认预设
+FORMAT="json"      # 报告格式: json | npz (长视频/片段很多时使用列式 npz)
+
+while [[ $# -gt 0 ]]; do
+    case $1 in
+        --preset)
+            PRESET="$2"
+            shift 2
+            ;;
+        --format)
+            FORMAT="$2"
+            shift 2
+            ;;
+        *)
+            shift
+            ;;
+    esac
+done
+
+if [ "$FORMAT" != "json" ] && [ "$FORMAT" != "npz" ]; then
+    output_json "{
+        \"status\": \"error\",
+        \"message\": \"不支持的报告格式: $FORMAT\",
+        \"hint\": \"--format 可选值: json, npz\"
+    }"
+    exit 1
+fi
+
 # 检查是否已有检测报告
-REPORT_FILE="$PROJECT_DIR/clips/detect-report.json"
+REPORT_FILE="$PROJECT_DIR/clips/detect-report.$FORMAT"
 
 if [ -f "$REPORT_FILE" ]; then
     # 如果已有报告,询问是否使用缓存
@@ -38,7 +67,22 @@ if [ -f "$REPORT_FILE" ]; then
 
     if [ "$REPORT_AGE" -lt 3600 ]; then
         # 1小时内的报告,建议使用缓存
-        CACHED_REPORT=$(cat "$REPORT_FILE")
+        if [ "$FORMAT" = "npz" ]; then
+            # npz 报告只输出摘要,完整片段列表可通过 report_format.py to-json 获取
+            CACHED_REPORT=$(run_python_script "report_format.py" to-json "$REPORT_FILE" --header-only)
+            if [ $? -ne 0 ]; then
+                output_json "{
+                    \"status\": \"error\",
+                    \"message\": \"无法读取缓存的检测报告\",
+                    \"report_file\": \"$REPORT_FILE\",
+                    \"details\": $(echo "$CACHED_REPORT" | jq -Rs .),
+                    \"hint\": \"请删除 clips/detect-report.npz 后重新运行 /detect\"
+                }"
+                exit 1
+            fi
+        else
+            CACHED_REPORT=$(cat "$REPORT_FILE")
+        fi
 
         output_json "{
             \"status\": \"success\",
@@ -49,31 +93,17 @@ if [ -f "$REPORT_FILE" ]; then
             \"cache_age_minutes\": $(($REPORT_AGE / 60)),
             \"message\": \"发现最近的检测报告($(($REPORT_AGE / 60))分钟前)\",
             \"report\": $CACHED_REPORT,
-            \"hint\": \"如果视频未改变,建议使用缓存结果。如需重新检测,请删除 clips/detect-report.json\"
+            \"hint\": \"如果视频未改变,建议使用缓存结果。如需重新检测,请删除 clips/detect-report.$FORMAT\"
         }"
         exit 0
     fi
 fi
 
-# 解析命令行参数
-PRESET="teaching"  # 默认预设
-
-while [[ $# -gt 0 ]]; do
-    case $1 in
-        --preset)
-            PRESET="$2"
-            shift 2
-            ;;
-        *)
-            shift
-            ;;
-    esac
-done
-
 # 调用 Python 检测脚本
 echo "正在分析视频..." >&2
 echo "视频文件: $VIDEO_FILE" >&2
 echo "检测预设: $PRESET" >&2
+echo "报告格式: $FORMAT" >&2
 echo "" >&2
 
 # 分别捕获 stdout（JSON）和 stderr（日志）
@@ -81,7 +111,11 @@ TEMP_STDOUT=$(mktemp)
 TEMP_STDERR=$(mktemp)
 trap "rm -f $TEMP_STDOUT $TEMP_STDERR" EXIT
 
-run_python_script "detect_silence.py" "$VIDEO_FILE" --preset "$PRESET" > "$TEMP_STDOUT" 2> "$TEMP_STDERR"
+if [ "$FORMAT" = "npz" ]; then
+    run_python_script "detect_silence.py" "$VIDEO_FILE" --preset "$PRESET" --format npz --output "$REPORT_FILE" > "$TEMP_STDOUT" 2> "$TEMP_STDERR"
+else
+    run_python_script "detect_silence.py" "$VIDEO_FILE" --preset "$PRESET" > "$TEMP_STDOUT" 2> "$TEMP_STDERR"
+fi
 EXIT_CODE=$?
 
 # 显示 Python 的日志输出
@@ -117,8 +151,10 @@ fi
 
 DETECT_RESULT=$(cat "$TEMP_STDOUT")
 
-# 保存检测报告
-echo "$DETECT_RESULT" > "$REPORT_FILE"
+# 保存检测报告(npz 已由 Python 脚本直接写入)
+if [ "$FORMAT" != "npz" ]; then
+    echo "$DETECT_RESULT" > "$REPORT_FILE"
+fi
 
 # 输出结果
 output_json "{
@@ -127,6 +163,7 @@ output_json "{
     \"project_path\": \"$PROJECT_DIR\",
     \"video_path\": \"$VIDEO_FILE\",
     \"preset\": \"$PRESET\",
+    \"report_format\": \"$FORMAT\",
     \"report_file\": \"$REPORT_FILE\",
     \"cached\": false,
     \"message\": \"检测完成，报告已保存\",
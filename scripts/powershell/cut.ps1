@@ -9,8 +9,14 @@ Test-Python
 $projectDir = Get-ClipMateRoot
 $projectName = Get-ProjectName
 
-# 检查检测报告是否存在
+# 检查检测报告是否存在(JSON 或列式 npz,两者都存在时使用较新的)
 $reportFile = Join-Path $projectDir "clips\detect-report.json"
+$npzReportFile = Join-Path $projectDir "clips\detect-report.npz"
+
+if ((Test-Path $npzReportFile) -and (-not (Test-Path $reportFile) -or
+    (Get-Item $npzReportFile).LastWriteTime -gt (Get-Item $reportFile).LastWriteTime)) {
+    $reportFile = $npzReportFile
+}
 
 if (-not (Test-Path $reportFile)) {
     $error = @{
@@ -23,9 +29,6 @@ if (-not (Test-Path $reportFile)) {
     exit 1
 }
 
-# 读取检测报告
-$reportData = Get-Content $reportFile -Raw
-
 # 解析命令行参数
 $mode = "auto"
 $previewOnly = $false
@@ -54,6 +57,26 @@ if (-not $videoFile) {
 
 # 如果是预览模式
 if ($previewOnly) {
+    # 读取检测报告(npz 仅在预览时转换为 JSON)
+    if ($reportFile -eq $npzReportFile) {
+        $reportData = Invoke-PythonScript "report_format.py" @("to-json", $reportFile)
+
+        if ($LASTEXITCODE -ne 0) {
+            $error = @{
+                status = "error"
+                message = "无法读取检测报告"
+                report_file = $reportFile
+                details = $reportData
+                hint = "请重新运行 /detect 生成检测报告"
+            } | ConvertTo-Json
+
+            Write-JsonOutput $error
+            exit 1
+        }
+    } else {
+        $reportData = Get-Content $reportFile -Raw
+    }
+
     $result = @{
         status = "preview"
         project_name = $projectName
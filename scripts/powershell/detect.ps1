@@ -27,8 +27,33 @@ if (-not $videoFile) {
 $clipsDir = Join-Path $projectDir "clips"
 Ensure-Directory $clipsDir
 
+# 解析命令行参数
+$preset = "teaching"
+$format = "json"  # 报告格式: json | npz (长视频/片段很多时使用列式 npz)
+for ($i = 0; $i -lt $args.Count; $i++) {
+    if ($args[$i] -eq "--preset" -and ($i + 1) -lt $args.Count) {
+        $preset = $args[$i + 1]
+        $i++
+    }
+    elseif ($args[$i] -eq "--format" -and ($i + 1) -lt $args.Count) {
+        $format = $args[$i + 1]
+        $i++
+    }
+}
+
+if ($format -ne "json" -and $format -ne "npz") {
+    $error = @{
+        status = "error"
+        message = "不支持的报告格式: $format"
+        hint = "--format 可选值: json, npz"
+    } | ConvertTo-Json
+
+    Write-JsonOutput $error
+    exit 1
+}
+
 # 检查是否已有检测报告
-$reportFile = Join-Path $clipsDir "detect-report.json"
+$reportFile = Join-Path $clipsDir "detect-report.$format"
 
 if (Test-Path $reportFile) {
     $fileAge = (Get-Date) - (Get-Item $reportFile).LastWriteTime
@@ -36,7 +61,27 @@ if (Test-Path $reportFile) {
 
     if ($ageMinutes -lt 60) {
         # 1小时内的报告,使用缓存
-        $cachedReport = Get-Content $reportFile -Raw | ConvertFrom-Json
+        if ($format -eq "npz") {
+            # npz 报告只输出摘要,完整片段列表可通过 report_format.py to-json 获取
+            $cachedReport = Invoke-PythonScript "report_format.py" @("to-json", $reportFile, "--header-only")
+
+            if ($LASTEXITCODE -ne 0) {
+                $error = @{
+                    status = "error"
+                    message = "无法读取缓存的检测报告"
+                    report_file = $reportFile
+                    details = $cachedReport
+                    hint = "请删除 clips\detect-report.npz 后重新运行 /detect"
+                } | ConvertTo-Json
+
+                Write-JsonOutput $error
+                exit 1
+            }
+
+            $cachedReport = $cachedReport | ConvertFrom-Json
+        } else {
+            $cachedReport = Get-Content $reportFile -Raw | ConvertFrom-Json
+        }
 
         $result = @{
             status = "success"
@@ -47,7 +92,7 @@ if (Test-Path $reportFile) {
             cache_age_minutes = $ageMinutes
             message = "发现最近的检测报告(${ageMinutes}分钟前)"
             report = $cachedReport
-            hint = "如果视频未改变,建议使用缓存结果。如需重新检测,请删除 clips\detect-report.json"
+            hint = "如果视频未改变,建议使用缓存结果。如需重新检测,请删除 clips\detect-report.$format"
         } | ConvertTo-Json -Depth 10
 
         Write-JsonOutput $result
@@ -55,22 +100,18 @@ if (Test-Path $reportFile) {
     }
 }
 
-# 解析命令行参数
-$preset = "teaching"
-for ($i = 0; $i -lt $args.Count; $i++) {
-    if ($args[$i] -eq "--preset" -and ($i + 1) -lt $args.Count) {
-        $preset = $args[$i + 1]
-        $i++
-    }
-}
-
 # 调用 Python 检测脚本
 Write-Host "正在分析视频..." -ForegroundColor Yellow
 Write-Host "视频文件: $videoFile" -ForegroundColor Yellow
 Write-Host "检测预设: $preset" -ForegroundColor Yellow
+Write-Host "报告格式: $format" -ForegroundColor Yellow
 Write-Host "" -ForegroundColor Yellow
 
-$detectResult = Invoke-PythonScript "detect_silence.py" @($videoFile, "--preset", $preset)
+if ($format -eq "npz") {
+    $detectResult = Invoke-PythonScript "detect_silence.py" @($videoFile, "--preset", $preset, "--format", "npz", "--output", $reportFile)
+} else {
+    $detectResult = Invoke-PythonScript "detect_silence.py" @($videoFile, "--preset", $preset)
+}
 
 if ($LASTEXITCODE -ne 0) {
     $error = @{
@@ -83,8 +124,10 @@ if ($LASTEXITCODE -ne 0) {
     exit 1
 }
 
-# 保存检测报告
-$detectResult | Out-File -FilePath $reportFile -Encoding UTF8
+# 保存检测报告(npz 已由 Python 脚本直接写入)
+if ($format -ne "npz") {
+    $detectResult | Out-File -FilePath $reportFile -Encoding UTF8
+}
 
 # 输出结果
 $result = @{
@@ -93,6 +136,7 @@ $result = @{
     project_path = $projectDir
     video_path = $videoFile
     preset = $preset
+    report_format = $format
     report_file = $reportFile
     cached = $false
     message = "检测完成，报告已保存"
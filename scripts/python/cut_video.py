@@ -10,11 +10,14 @@ import subprocess
 import os
 from pathlib import Path
 
+import numpy as np
+
+from report_format import load_report as read_report, segment_columns
+
 def load_report(report_path):
-    """加载检测报告"""
+    """加载检测报告(JSON 或列式 .npz)"""
     try:
-        with open(report_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(report_path)
     except Exception as e:
         print(json.dumps({
             "status": "error",
@@ -53,10 +56,12 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
     简化版视频剪辑
     使用 FFmpeg 的 select 过滤器删除片段
     """
-    silence_segments = report.get('silence_segments', [])
-    repeat_segments = report.get('repeat_segments', [])
+    silence_start, silence_end, silence_duration = segment_columns(report, 'silence')
+    repeat_duration = segment_columns(report, 'repeat')[2]
+    silence_count = len(silence_start)
+    repeat_count = len(repeat_duration)
 
-    if not silence_segments and not repeat_segments:
+    if not silence_count and not repeat_count:
         return {
             "status": "success",
             "message": "没有需要剪辑的片段",
@@ -70,12 +75,9 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
             }
         }
 
-    # 合并所有要删除的片段
-    all_delete_segments = silence_segments.copy()
-
     # 计算时间节省
-    total_deleted_time = sum(s['duration'] for s in silence_segments)
-    total_repeat_time = sum(s['duration'] for s in repeat_segments)
+    total_deleted_time = float(silence_duration.sum())
+    total_repeat_time = float(repeat_duration.sum())
     time_saved = total_deleted_time + (total_repeat_time * 0.5)  # 重复片段加速2x节省50%
 
     video_duration = report['video_info']['duration']
@@ -83,18 +85,18 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
 
     # 生成 FFmpeg 命令
     # 简化版:只删除静音片段,不处理加速
-    if silence_segments:
+    if silence_count:
         try:
             # 使用复杂过滤器
             # 构建时间段列表
             keep_segments = []
-            all_segments = sorted(silence_segments, key=lambda x: x['start'])
+            order = np.argsort(silence_start, kind='stable')
 
             current_time = 0.0
-            for seg in all_segments:
-                if current_time < seg['start']:
-                    keep_segments.append((current_time, seg['start']))
-                current_time = seg['end']
+            for start, end in zip(silence_start[order].tolist(), silence_end[order].tolist()):
+                if current_time < start:
+                    keep_segments.append((current_time, start))
+                current_time = end
 
             # 添加最后一段
             if current_time < video_duration:
@@ -106,11 +108,11 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
                 # 这里简化处理:只报告将要执行的操作
                 return {
                     "status": "success",
-                    "message": f"将删除 {len(silence_segments)} 个静音片段",
+                    "message": f"将删除 {silence_count} 个静音片段",
                     "output_path": output_path,
                     "statistics": {
-                        "deleted_count": len(silence_segments),
-                        "spedup_count": len(repeat_segments),
+                        "deleted_count": silence_count,
+                        "spedup_count": repeat_count,
                         "original_duration": video_duration,
                         "new_duration": round(new_duration, 2),
                         "time_saved": round(time_saved, 2)
@@ -119,7 +121,7 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
                 }
 
             # 简单情况:使用 FFmpeg concat
-            print(f"正在剪辑视频 (删除 {len(silence_segments)} 个片段)...", file=sys.stderr)
+            print(f"正在剪辑视频 (删除 {silence_count} 个片段)...", file=sys.stderr)
 
             # 生成临时片段列表
             temp_dir = Path(output_path).parent / "temp"
@@ -183,7 +185,7 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
                         "message": "视频剪辑完成",
                         "output_path": output_path,
                         "statistics": {
-                            "deleted_count": len(silence_segments),
+                            "deleted_count": silence_count,
                             "spedup_count": 0,
                             "original_duration": video_duration,
                             "new_duration": round(new_duration, 2),
@@ -211,7 +213,7 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
         "output_path": input_path,
         "statistics": {
             "deleted_count": 0,
-            "spedup_count": len(repeat_segments),
+            "spedup_count": repeat_count,
             "original_duration": video_duration,
             "new_duration": video_duration,
             "time_saved": 0
@@ -222,7 +224,7 @@ def cut_video_simple(input_path, output_path, report, mode='auto'):
 def main():
     parser = argparse.ArgumentParser(description='智能视频剪辑')
     parser.add_argument('video', help='视频文件路径')
-    parser.add_argument('--report', required=True, help='检测报告文件路径')
+    parser.add_argument('--report', required=True, help='检测报告文件路径(.json 或 .npz)')
     parser.add_argument('--mode', default='auto', choices=['auto', 'interactive', 'custom'],
                         help='剪辑模式')
     parser.add_argument('--output', help='输出文件路径')
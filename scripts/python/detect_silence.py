@@ -296,9 +296,15 @@ def main():
     parser.add_argument('video', help='视频文件路径')
     parser.add_argument('--preset', default='teaching', choices=['teaching', 'meeting', 'vlog', 'short'],
                         help='检测预设')
+    parser.add_argument('--format', default='json', choices=['json', 'npz'],
+                        help='报告格式: json 输出到 stdout; npz 写入 --output 并只输出摘要')
+    parser.add_argument('--output', help='npz 报告输出路径')
 
     args = parser.parse_args()
 
+    if args.format == 'npz' and not args.output:
+        parser.error('--format npz 需要指定 --output')
+
     # 检查依赖
     check_dependencies()
 
@@ -386,6 +392,12 @@ def main():
         "config": preset_config
     }
 
+    # 长视频/细阈值下片段很多,npz 以列存储片段,stdout 只输出摘要
+    if args.format == 'npz':
+        from report_format import save_report_npz
+        result = save_report_npz(result, args.output)
+        result["report_file"] = args.output
+
     print(json.dumps(result, ensure_ascii=False, indent=2))
 
 if __name__ == "__main__":
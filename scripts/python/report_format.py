@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+检测报告列式格式 - .npz 读写与 JSON 互转
+
+布局(未压缩 .npz,每列一个 .npy 成员):
+  header              uint8   UTF-8 JSON: video_info/statistics/recommendations/preset/config 等
+  silence_start/end/duration                 float64
+  repeat_start/end/duration/similarity       float64
+  scene_changes                              float64
+
+成员以 ZIP_STORED 方式存储,读取时直接按偏移 memmap,无需解析或拷贝整个文件。
+"""
+
+import sys
+import json
+import argparse
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+# 片段类型 -> 列名
+SEGMENT_COLUMNS = {
+    "silence": ("start", "end", "duration"),
+    "repeat": ("start", "end", "duration", "similarity"),
+}
+
+# 不进入 header 的键(以列存储)
+COLUMN_KEYS = ("silence_segments", "repeat_segments", "scene_changes")
+
+
+def save_report_npz(report, output_path):
+    """
+    将 JSON 报告写为列式 .npz
+
+    Returns:
+        header: 不含片段列的报告摘要
+    """
+    header = {key: value for key, value in report.items() if key not in COLUMN_KEYS}
+    header["format_version"] = FORMAT_VERSION
+
+    arrays = {
+        "header": np.frombuffer(
+            json.dumps(header, ensure_ascii=False).encode("utf-8"), dtype=np.uint8
+        )
+    }
+    for kind, fields in SEGMENT_COLUMNS.items():
+        segments = report.get(f"{kind}_segments", [])
+        for field in fields:
+            arrays[f"{kind}_{field}"] = np.array(
+                [seg[field] for seg in segments], dtype=np.float64
+            )
+    arrays["scene_changes"] = np.array(report.get("scene_changes", []), dtype=np.float64)
+
+    # np.savez 不压缩,保证成员可被 memmap
+    with open(output_path, "wb") as f:
+        np.savez(f, **arrays)
+
+    return header
+
+
+class ColumnarReport:
+    """
+    惰性读取的列式检测报告
+
+    header 键可像 dict 一样访问(report['video_info']),
+    片段列通过 column()/segments() 按需 memmap。
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._members = {}
+        self._columns = {}
+
+        with zipfile.ZipFile(self.path) as zf:
+            for info in zf.infolist():
+                name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+                self._members[name] = info
+
+        self.header = json.loads(bytes(self.column("header")).decode("utf-8"))
+
+        version = self.header.get("format_version")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"不支持的报告格式版本: {version} (当前支持: {FORMAT_VERSION})"
+            )
+
+    def column(self, name):
+        """返回列数组(只读,尽可能零拷贝)"""
+        if name not in self._columns:
+            if name not in self._members:
+                raise KeyError(f"报告中不存在列: {name}")
+            self._columns[name] = self._read_member(self._members[name])
+        return self._columns[name]
+
+    def _read_member(self, info):
+        with open(self.path, "rb") as f:
+            header = None
+            if info.compress_type == zipfile.ZIP_STORED:
+                # 跳过 ZIP 本地文件头(30 字节 + 文件名 + 扩展字段)
+                f.seek(info.header_offset)
+                local_header = f.read(30)
+                name_len = int.from_bytes(local_header[26:28], "little")
+                extra_len = int.from_bytes(local_header[28:30], "little")
+                f.seek(info.header_offset + 30 + name_len + extra_len)
+
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    header = np.lib.format.read_array_header_1_0(f)
+                elif version == (2, 0):
+                    header = np.lib.format.read_array_header_2_0(f)
+
+            if header is None:
+                # 压缩成员或未知 .npy 版本无法 memmap,退回常规读取
+                with zipfile.ZipFile(f) as zf, zf.open(info) as member:
+                    return np.lib.format.read_array(member)
+
+            shape, fortran_order, dtype = header
+            offset = f.tell()
+
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=dtype)
+
+        return np.memmap(
+            self.path, dtype=dtype, mode="r", offset=offset, shape=shape,
+            order="F" if fortran_order else "C"
+        )
+
+    def segments(self, kind):
+        """返回 (start, end, duration) 三列"""
+        return tuple(self.column(f"{kind}_{field}") for field in ("start", "end", "duration"))
+
+    def _column_members(self, key):
+        """片段键对应的列成员名"""
+        if key == "scene_changes":
+            return ["scene_changes"]
+        kind = key[:-len("_segments")]
+        return [f"{kind}_{field}" for field in SEGMENT_COLUMNS[kind]]
+
+    def _column_value(self, key):
+        """将单个片段键还原为 JSON 结构"""
+        if key == "scene_changes":
+            return self.column("scene_changes").tolist()
+        fields = SEGMENT_COLUMNS[key[:-len("_segments")]]
+        columns = [self.column(name).tolist() for name in self._column_members(key)]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+    def get(self, key, default=None):
+        if key in COLUMN_KEYS:
+            if not all(name in self._members for name in self._column_members(key)):
+                return default
+            return self._column_value(key)
+        return self.header.get(key, default)
+
+    def __getitem__(self, key):
+        if key in COLUMN_KEYS:
+            return self._column_value(key)
+        return self.header[key]
+
+    def to_dict(self):
+        """转换为与 detect_silence.py JSON 输出一致的结构"""
+        segment_lists = {key: self._column_value(key) for key in COLUMN_KEYS}
+
+        report = {}
+        for key, value in self.header.items():
+            if key == "format_version":
+                continue
+            report[key] = value
+            if key == "video_info":
+                report.update(segment_lists)
+        for key, value in segment_lists.items():
+            report.setdefault(key, value)
+        return report
+
+
+def load_report(report_path):
+    """按扩展名加载报告: .npz 返回 ColumnarReport,其余按 JSON 解析"""
+    if Path(report_path).suffix == ".npz":
+        return ColumnarReport(report_path)
+    with open(report_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def segment_columns(report, kind):
+    """
+    以数组形式取出片段的 (start, end, duration)
+
+    兼容 JSON dict 报告与 ColumnarReport
+    """
+    if isinstance(report, ColumnarReport):
+        return report.segments(kind)
+
+    segments = report.get(f"{kind}_segments", [])
+    return tuple(
+        np.array([seg[field] for seg in segments], dtype=np.float64)
+        for field in ("start", "end", "duration")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='检测报告格式转换')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    to_json = subparsers.add_parser('to-json', help='将 .npz 报告转换为 JSON')
+    to_json.add_argument('report', help='.npz 报告路径')
+    to_json.add_argument('--header-only', action='store_true',
+                         help='只输出 header(不含片段列表)')
+
+    to_npz = subparsers.add_parser('to-npz', help='将 JSON 报告转换为 .npz')
+    to_npz.add_argument('report', help='JSON 报告路径')
+    to_npz.add_argument('--output', required=True, help='输出 .npz 路径')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'to-json':
+            report = ColumnarReport(args.report)
+            result = report.header if args.header_only else report.to_dict()
+        else:
+            report = load_report(args.report)
+            result = save_report_npz(report, args.output)
+    except Exception as e:
+        print(json.dumps({
+            "status": "error",
+            "message": f"无法转换检测报告: {str(e)}"
+        }, ensure_ascii=False))
+        sys.exit(1)
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()